@@ -11,41 +11,105 @@
 #Another difference is whether the dealer should hit or stand on a soft 17 (Ace + 6).
 #This game is implemented to stand on soft 17, as in many Vegas casinos.
 
+import argparse
+import re
+import sys
 from random import shuffle
 from time import sleep
 
-#Adding some sleep(1) statements makes this more fun, as a command-line game:
-#it builds suspense and tension
+#Adding some pauses makes this more fun, as a command-line game: it builds
+#suspense and tension. play_game(pause=False) (or running with --no-pause) turns
+#them off, e.g. when the output is being scripted or logged.
+_PAUSE_SECONDS = 1
 
 SUITS = ["♠", "♥", "♦", "♣"]
 
-RANKS_POINTS = {"A": 11, "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, 
-"9": 9, "10": 10, "J": 10, "Q": 10, "K": 10}
+#A card's rank index (Card.rank_idx) is its position in RANKS, and POINTS gives its
+#points by that same index.
+RANKS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+POINTS = (11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+RANKS_POINTS = dict(zip(RANKS, POINTS))
 
 LIMIT = 21
 
+#Prompts for a player's move, and the answers each one accepts
+PROMPT = "Do you want to [H]it, [S]tand, or [D]ouble Down? "
+CHOICES = frozenset("HSD")
+SPLIT_PROMPT = "Do you want to [H]it, [S]tand, s[P]lit, or [D]ouble Down? "
+CHOICES_WITH_SPLIT = frozenset("HSDP")
+
+#Position of the Ace in RANKS, for comparing against Card.rank_idx
+ACE = 0
+
+#SPLITTABLE[a][b] is True if 2 cards with rank indexes a and b form a pair that can be
+#split. Only cards of the same rank count as a pair here (so not a 10 and a J), but
+#a house that pairs any two 10-point cards would only need to change this table.
+SPLITTABLE = tuple(tuple(a == b for b in range(len(RANKS))) for a in range(len(RANKS)))
+
+class _Log(object):
+    '''Collects the game's messages and writes them to stdout in one go.'''
+
+    def __init__(self):
+        self.buf = []
+
+    def __call__(self, message):
+        self.buf.append(message)
+
+    def flush(self):
+        '''Write out all messages collected so far'''
+
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            self.buf.clear()
+
+
+log = _Log()
+
+#Messages are flushed at the end of each round, and also whenever the game pauses
+#or asks for input, so players always see everything that has happened so far.
+
+
+def _ask(prompt):
+    '''Show any pending messages, then read the player's response to prompt'''
+
+    log.flush()
+    return input(prompt)
+
+
+def _pause():
+    '''Wait a moment for dramatic effect, unless pauses are turned off'''
+
+    if _PAUSE_SECONDS:
+        log.flush()
+        sleep(_PAUSE_SECONDS)
+
+
 class Card(object):
     '''A card in a deck of cards.'''
 
-    def __init__(self, name, points):
+    def __init__(self, name, points, rank_idx):
         self.name = name
         self.points = points
+        self.rank_idx = rank_idx
 
     def __repr__(self):
         return self.name
 
 
+#Cards are never modified once created (a hand tracks its own soft aces), so the 52
+#of them are built once at import and every new deck just shuffles the same cards.
+CARDS = tuple(Card(f"{rank}{suit}", POINTS[rank_idx], rank_idx) for suit in SUITS
+    for rank_idx, rank in enumerate(RANKS))
+
+
 class Deck(list):
     '''A stack of all cards.'''
 
     def __init__(self):
         '''Create and shuffle a new 52-card deck'''
 
-        for suit in SUITS:
-            for rank in RANKS_POINTS:
-                new_card = Card(f"{rank}{suit}", RANKS_POINTS[rank])
-                self.append(new_card)
-
+        super().__init__(CARDS)
         shuffle(self)
 
     def deal(self):
@@ -59,44 +123,89 @@ class Hand(list):
 
     def __init__(self):
         self.value = 0
+        self.soft_aces = 0
         self.blackjack = False
+        self._repr_cache = None
+
+    def __repr__(self):
+        #A hand is displayed many times a round but only changes in add_card,
+        #so its display string is built once per change.
+        if self._repr_cache is None:
+            self._repr_cache = "[" + ", ".join(card.name for card in self) + "]"
+
+        return self._repr_cache
 
     def add_card(self, card):
         '''Add card to hand and update hand's point value. Treat Aces as value 1 
         instead of 11 if it will prevent hand from going bust.'''
 
         self.append(card)
-
-        if card.name.startswith("A") and self.value > 10:
-            card.points = 1
-
+        self._repr_cache = None
         self.value += card.points
-        return self.value
 
-    def check_blackjack(self):
-        '''Determine if hand is a natural blackjack'''
+        if card.rank_idx == ACE:
+            self.soft_aces += 1
 
-        self.blackjack = ((len(self) == 2) and self.value == LIMIT)
+        return self.reset_ace_value()
 
     def reset_ace_value(self):
-        '''If hand value >21 and it contains an ace, reset its value from 11 to 1
+        '''If hand value >21 and an ace is still counted as 11, count it as 1 instead
         to prevent going bust.'''
 
-        if self.value > LIMIT:
-            for card in self:
-                if card.name.startswith("A") and card.points == 11:
-                    card.points = 1
-                    self.value -= 10
+        while self.value > LIMIT and self.soft_aces:
+            self.value -= 10
+            self.soft_aces -= 1
 
         return self.value
 
+    def check_blackjack(self):
+        '''Determine if hand is a natural blackjack'''
+
+        self.blackjack = ((len(self) == 2) and self.value == LIMIT)
+
     def draw_card(self, deck):
         '''Give an additional card to a hand and recalculate hand value'''
 
         new_card = deck.deal()
         self.add_card(new_card)
-        self.reset_ace_value()
-        print(f"This hand draws a {new_card}. Its value is now {self.value}.")
+        log(f"This hand draws a {new_card}. Its value is now {self.value}.")
+
+
+def validate_wager(wager, maximum):
+    '''Check to make sure player isn't wagering more money than they have'''
+
+    return wager <= maximum
+
+
+#Only plain digits count as a whole number, so a negative "wager" can't be used to
+#gain money.
+_INT_RE = re.compile(r"^\s*(\d+)\s*$")
+
+
+def _read_int(prompt):
+    '''Ask prompt until the player enters a whole number, and return it'''
+
+    while True:
+        match = _INT_RE.match(_ask(prompt))
+        if match:
+            return int(match.group(1))
+
+        log("Please enter a whole number.")
+
+
+def _read_wager(prompt, maximum):
+    '''Ask for a wager until the player enters a whole number they can afford'''
+
+    while True:
+        wager = _read_int(prompt)
+
+        if validate_wager(wager, maximum):
+            return wager
+
+        log(f"You cannot wager that much. The most you can wager is ${maximum}.")
+
+#The wager-taking methods below accept a "source" function in place of _read_wager,
+#so that something other than the keyboard (e.g. a script or test) can place bets.
 
 
 class Player(object):
@@ -110,53 +219,45 @@ class Player(object):
     def __repr__(self):
         return self.name
 
-    def make_bet(self):
+    def make_bet(self, source=_read_wager):
         '''Ask player to make a bet for the round'''
 
-        print(f"{self.name}, you have ${self.money} to wager.")
-        while True:
-            wager = int(input("How much do you wager for this round? "))
-            if not validate_wager(wager, self.money):
-                continue
-            else:
-                self.wager = wager
-                self.money -= self.wager
-                break
+        log(f"{self.name}, you have ${self.money} to wager.")
+        self.wager = source("How much do you wager for this round? ", self.money)
+        self.money -= self.wager
 
     def reveal_initial_hand(self):
         '''Display player's initial 2-card hand and determine if it is blackjack'''
 
-        print(f"{self.name}, your hand is {self.hand}. Its value is {self.hand.value}.")
+        log(f"{self.name}, your hand is {self.hand}. Its value is {self.hand.value}.")
         self.hand.check_blackjack()
         if self.hand.blackjack:
-            print("This is a natural blackjack! You will win unless the dealer also has a natural blackjack.")
-        sleep(1)
+            log("This is a natural blackjack! You will win unless the dealer also has a natural blackjack.")
+        _pause()
 
     def split_hand(self, deck):
         '''Split a pair of cards into 2 new 2-card hands and arrange 2nd wager'''
 
-        split_card = self.hand.pop()
-        self.hand.value -= split_card.points
+        first_card, split_card = self.hand
 
-        if split_card.name.startswith("A"):
-            split_card.points = 11
-        
+        self.hand = Hand()
+        self.hand.add_card(first_card)
         self.second_hand = Hand()
         self.second_hand.add_card(split_card)
         self.hand.add_card(deck.deal())
         self.second_hand.add_card(deck.deal())
         self.second_wager = self.wager
         self.money -= self.second_wager
-        print(f"Your new hands are {self.hand} and {self.second_hand}.")
+        log(f"Your new hands are {self.hand} and {self.second_hand}.")
 
     def cash_out(self):
         '''Allow player to exit the game'''
 
-        print(f"{self.name}, you are cashing out with ${self.money}.")
+        log(f"{self.name}, you are cashing out with ${self.money}.")
 
         if self.money > 1000:
             profit = self.money - 1000
-            print(f"You won ${profit} this game!")
+            log(f"You won ${profit} this game!")
 
         self.cashout = True
 
@@ -174,7 +275,7 @@ class Dealer(object):
         '''Display dealer's faceup card'''
 
         faceup = self.hand[-1]
-        print(f"The dealer's faceup card is {faceup}. Their other card is facedown.")
+        log(f"The dealer's faceup card is {faceup}. Their other card is facedown.")
         return faceup
 
 
@@ -182,7 +283,7 @@ def instantiate_players(player_count, players):
     '''Create the required number of new Player objects and add them to list of players'''
 
     for i in range (0, player_count):
-        name = input(f"What is Player {i+1}'s name? ")
+        name = _ask(f"What is Player {i+1}'s name? ")
         new_player = Player(name)
         players.append(new_player)
 
@@ -200,16 +301,6 @@ def reset_for_new_round(players, dealer):
     dealer.hand = Hand()
 
 
-def validate_wager(wager, maximum):
-    '''Check to make sure player isn't wagering more money than they have'''
-
-    if wager > maximum:
-        print(f"You cannot wager that much. The most you can wager is ${maximum}.")
-        return False
-
-    return True
-
-
 def deal_hands(deck, players, dealer):
     '''Deal 2 cards to each player and to the dealer'''
 
@@ -226,44 +317,39 @@ def payout_natural_blackjacks(players):
         if player.hand.blackjack:   
             winnings = player.wager + int(1.5 * player.wager)
             player.money += winnings
-            print(f"{player.name}, you have won 1.5 times your wager of ${player.wager} and now have ${player.money}.")
-            print("Play will continue for any remaining players.")
+            log(f"{player.name}, you have won 1.5 times your wager of ${player.wager} and now have ${player.money}.")
+            log("Play will continue for any remaining players.")
 
 
 def handle_dealer_blackjack(dealer, players):
     '''If dealer has natural blackjack, compare it to player hands'''
 
-    print(f"The dealer's hand is {dealer.hand} -- a natural blackjack.")
-    sleep(1)
+    log(f"The dealer's hand is {dealer.hand} -- a natural blackjack.")
+    _pause()
 
     for player in players:
         if player.hand.blackjack:
-            print(f"{player.name}, your blackjack ties the dealer's blackjack.")
+            log(f"{player.name}, your blackjack ties the dealer's blackjack.")
             player.money += player.wager
-            print(f"You win back your wager of ${player.wager} and have ${player.money} again.")
+            log(f"You win back your wager of ${player.wager} and have ${player.money} again.")
         else:
             player.stand = True
-            print(f"{player.name}, the dealer's blackjack beats your hand. Your bet of ${player.wager} is forfeit.")
-        sleep(1)
+            log(f"{player.name}, the dealer's blackjack beats your hand. Your bet of ${player.wager} is forfeit.")
+        _pause()
 
-    print("The round is over.")
+    log("The round is over.")
 
 
-def double_down(player, hand, deck, wager):
+def double_down(player, hand, deck, wager, source=_read_wager):
     '''Add money to bet & draw additional card for a double-down'''
 
     max_wager = min(wager, player.money)
 
-    while True:
-        additional_wager = int(input(f"How much more would you like to wager? It can be up to ${max_wager}. "))
-        if not validate_wager(additional_wager, max_wager):
-            continue
-        else:
-            wager += additional_wager
-            player.money -= additional_wager
-            hand.draw_card(deck)
-            player.stand = True
-            break
+    additional_wager = source(f"How much more would you like to wager? It can be up to ${max_wager}. ", max_wager)
+    wager += additional_wager
+    player.money -= additional_wager
+    hand.draw_card(deck)
+    player.stand = True
 
     return wager
 
@@ -279,13 +365,13 @@ def payout_hand(player, player_hand, player_wager):
 
     winnings = 2*player_wager
     player.money += winnings
-    print(f"{player.name}, your hand {player_hand} has won ${winnings}.")
+    log(f"{player.name}, your hand {player_hand} has won ${winnings}.")
 
 
 def payout_after_dealer_bust(players):
     '''For-loop to dispense winnings for all remaining hands if dealer has gone bust'''
 
-    print("The dealer's hand is bust! All remaining players win this round.")
+    log("The dealer's hand is bust! All remaining players win this round.")
 
     for player in players:
         if player.stand:
@@ -296,25 +382,25 @@ def payout_after_dealer_bust(players):
                 if player.second_hand.value <= LIMIT:
                     payout_hand(player, player.second_hand, player.second_wager)
 
-            print(f"You now have ${player.money}.")
-            sleep(1)
+            log(f"You now have ${player.money}.")
+            _pause()
 
 
 def compare_hand(player, player_hand, dealer_hand, player_wager):
     '''Compare a single hand to the dealer's final hand'''
 
     if dealer_hand.value > player_hand.value:
-        print(f"{player.name}, the dealer's hand beats your hand {player_hand}.")
-        print(f"Your bet is forfeit. You now have ${player.money}.")
+        log(f"{player.name}, the dealer's hand beats your hand {player_hand}.")
+        log(f"Your bet is forfeit. You now have ${player.money}.")
 
     elif dealer_hand.value == player_hand.value:
-        print(f"{player.name}, your hand {player_hand} has tied the dealer.")
+        log(f"{player.name}, your hand {player_hand} has tied the dealer.")
         player.money += player_wager
-        print(f"We are returning your ${player_wager} bet to you. You have ${player.money} again.")
+        log(f"We are returning your ${player_wager} bet to you. You have ${player.money} again.")
 
     else:
         payout_hand(player, player_hand, player_wager)
-        print(f"You now have ${player.money}.")
+        log(f"You now have ${player.money}.")
 
 
 def compare_multiple_hands(players, dealer):
@@ -329,19 +415,19 @@ def compare_multiple_hands(players, dealer):
                 if player.second_hand.value <= LIMIT:
                     compare_hand(player, player.second_hand, dealer.hand, player.second_wager) 
 
-            sleep(1)
+            _pause()
 
 
 def resolve_dealer_hand(deck, dealer, players):
     '''Reveal dealer's hand, draw additional cards if its value is less than 17,
     then compare it to hands of remaining players'''
 
-    print(f"The dealer's hand is {dealer.hand}. Its value is {dealer.hand.value}.")
-    sleep(1)
+    log(f"The dealer's hand is {dealer.hand}. Its value is {dealer.hand.value}.")
+    _pause()
 
     while dealer.hand.value < 17:
         dealer.hand.draw_card(deck)
-        sleep(1)
+        _pause()
 
     if dealer.hand.value > LIMIT:
         payout_after_dealer_bust(players)
@@ -351,41 +437,58 @@ def resolve_dealer_hand(deck, dealer, players):
         compare_multiple_hands(players, dealer)
 
 
-def remove_bankrupt_players(players):
-    '''Take player(s) out of the game if they have no money at the end of a round.'''
+def announce_bankrupt_players(players):
+    '''Tell any player(s) who have no money at the end of a round that they must leave.'''
 
     for player in players:
         if player.money == 0:
-            print(f"{player.name}, you have lost all your money and will need to leave the game.")
-
-    players[:] = [player for player in players if not player.money == 0]
-
-    #Doing this as a list comprehension with list slice to avert the bug that occurred
-    #if 2 or more players went bankrupt in the same round.
+            log(f"{player.name}, you have lost all your money and will need to leave the game.")
 
 
 def ask_to_continue(players):
-    '''Ask if each player wants to play another round; remove players who quit'''
+    '''Ask if each player who still has money wants to play another round'''
 
     for player in players:
+        if player.money == 0:
+            continue
+
         while True:
-            again = input(f"{player.name}, do you want to play again? Y/N ")
+            again = _ask(f"{player.name}, do you want to play again? Y/N ")
             if again.upper() == "Y":
                 break
             elif again.upper() == "N":
                 player.cash_out()
                 break
             else:
-                print("Input not valid, try again")
+                log("Input not valid, try again")
                 continue
 
-    players[:] = [player for player in players if not player.cashout]
 
+def remove_departed_players(players):
+    '''Take player(s) out of the game if they are bankrupt or have cashed out.'''
+
+    if all(player.money and not player.cashout for player in players):
+        return
+
+    kept = 0
+    for player in players:
+        if player.money and not player.cashout:
+            players[kept] = player
+            kept += 1
+
+    del players[kept:]
 
-def play_game():
+    #Compacting the list in place (rather than removing players while looping over it)
+    #averts the bug that occurred if 2 or more players left in the same round.
+
+
+def play_game(pause=True):
     '''Function to run the entire blackjack game'''
 
-    print("Welcome to Blackjack!")
+    global _PAUSE_SECONDS
+    _PAUSE_SECONDS = 1 if pause else 0
+
+    log("Welcome to Blackjack!")
 
     players = []
     dealer = Dealer()
@@ -393,12 +496,12 @@ def play_game():
     #Vegas blackjack tables typically have a 7-person maximum so our game will as well.
     #This also helps ensure that a single deck per round will suffice.
     while True:
-        player_count = int(input("How many people are playing? "))
+        player_count = _read_int("How many people are playing? ")
         if player_count < 8:
             instantiate_players(player_count, players)
             break
         else:
-            print("This blackjack table has a 7-player maximum.")
+            log("This blackjack table has a 7-player maximum.")
             continue
 
     #This while loop runs a single round of Blackjack.
@@ -419,25 +522,25 @@ def play_game():
 
         faceup = dealer.reveal_faceup()
 
-        if faceup.points == 10 or faceup.name.startswith("A"):
+        if faceup.points == 10 or faceup.rank_idx == ACE:
         #If-statement was originally written to check if faceup.points == 10 or 11, but
         #this resulted in a bug when dealer's hand contained two Aces (and the 2nd Ace
         #therefore had had its value reset to 1).
 
-            print(f"Therefore, the dealer must check to see if they have a natural blackjack.")
+            log(f"Therefore, the dealer must check to see if they have a natural blackjack.")
             dealer.hand.check_blackjack()
-            sleep(1)
+            _pause()
 
             if dealer.hand.blackjack == True:
                 handle_dealer_blackjack(dealer, players)
             else:
-                print("The dealer's hand is not a blackjack.")
+                log("The dealer's hand is not a blackjack.")
                 payout_natural_blackjacks(players)
         else:
-            print("It is impossible for the dealer to have a natural blackjack.")
+            log("It is impossible for the dealer to have a natural blackjack.")
             payout_natural_blackjacks(players)
 
-        sleep(1)
+        _pause()
 
         #This for-loop allows each of the remaining players to hit, stand, or double down in turn.
 
@@ -445,40 +548,37 @@ def play_game():
             if player.hand.blackjack == False and player.stand == False:
                 while player.hand.value < LIMIT:
 
-                    print(f"{player.name}, your hand is currently worth {player.hand.value}.")
+                    log(f"{player.name}, your hand is currently worth {player.hand.value}.")
 
                     #Allows player to split if and only if they were initally dealt a pair, 
                     #and if they have sufficient money to double their bet.
-                    if (len(player.hand) == 2 and player.hand[0].name[0] == player.hand[1].name[0] 
+                    if (len(player.hand) == 2 and SPLITTABLE[player.hand[0].rank_idx][player.hand[1].rank_idx]
                     and player.second_hand == None and player.money >= player.wager):
-                        choice = input("Do you want to [H]it, [S]tand, s[P]lit, or [D]ouble Down? ")
-                        valid_choices = {"H", "S", "D", "P"}
-
-                        if choice.upper() not in valid_choices:
-                            print("Choice not recognized, try again")
-
-                        #Splits pair (if desired) and handles special case of splitting a pair of aces.
-                        if choice.upper() == "P":
-                            player.split_hand(game_deck)
-                            if player.hand[0].name.startswith("A") and player.second_hand[0].name.startswith("A"):
-                                print("Because you split a pair of aces, you will get no more cards. Both these hands stand.")
-                                player.stand = True
-                                break
-
+                        prompt, valid_choices = SPLIT_PROMPT, CHOICES_WITH_SPLIT
                     else:
-                        choice = input("Do you want to [H]it, [S]tand, or [D]ouble Down? ")
-                        valid_choices = {"H", "S", "D"}
-                        if choice.upper() not in valid_choices:
-                            print("Choice not recognized, try again")
+                        prompt, valid_choices = PROMPT, CHOICES
+
+                    choice = _ask(prompt).upper()
+                    if choice not in valid_choices:
+                        log("Choice not recognized, try again")
+                        continue
+
+                    #Splits pair (if desired) and handles special case of splitting a pair of aces.
+                    if choice == "P":
+                        player.split_hand(game_deck)
+                        if player.hand[0].rank_idx == ACE and player.second_hand[0].rank_idx == ACE:
+                            log("Because you split a pair of aces, you will get no more cards. Both these hands stand.")
+                            player.stand = True
+                            break
 
-                    if choice.upper() == "H":
+                    elif choice == "H":
                         player.hand.draw_card(game_deck)
 
-                    elif choice.upper() == "S":
+                    elif choice == "S":
                         player.stand = True
                         break
 
-                    elif choice.upper() == "D":
+                    elif choice == "D":
                         wager = double_down(player, player.hand, game_deck, player.wager)
                         player.wager = wager
                         break
@@ -487,29 +587,29 @@ def play_game():
                     player.stand = True
 
                 if player.hand.value > LIMIT:
-                    print(f"This hand is bust, your ${player.wager} bet is forfeit.")
+                    log(f"This hand is bust, your ${player.wager} bet is forfeit.")
                     player.stand = False
 
                 #Allows player to hit, stand or double-down on their second (split) hand,
                 #as long as the split was not of a pair of aces.
                 if player.second_hand:
-                    if not player.second_hand[0].name.startswith("A"):
+                    if not player.second_hand[0].rank_idx == ACE:
                         while player.second_hand.value < LIMIT:
-                            print(f"{player.name}, your second hand is currently worth {player.second_hand.value}.")
+                            log(f"{player.name}, your second hand is currently worth {player.second_hand.value}.")
 
-                            choice = input("Do you want to [H]it, [S]tand, or [D]ouble Down? ")
-                            valid_choices = {"H", "S", "D"}
-                            if choice.upper() not in valid_choices:
-                                print("Choice not recognized, try again")
+                            choice = _ask(PROMPT).upper()
+                            if choice not in CHOICES:
+                                log("Choice not recognized, try again")
+                                continue
 
-                            if choice.upper() == "H":
+                            if choice == "H":
                                 player.second_hand.draw_card(game_deck)
 
-                            elif choice.upper() == "S":
+                            elif choice == "S":
                                 player.stand = True
                                 break
 
-                            elif choice.upper() == "D":
+                            elif choice == "D":
                                 wager = double_down(player, player.second_hand, game_deck, player.second_wager)
                                 player.second_wager = wager
                                 break
@@ -518,29 +618,38 @@ def play_game():
                             player.stand = True
 
                         if player.second_hand.value > LIMIT:
-                            print(f"This hand is bust, your ${player.second_wager} bet is forfeit.")
+                            log(f"This hand is bust, your ${player.second_wager} bet is forfeit.")
                             if not player.stand == True:
                                 player.stand = False
 
-        sleep(1)
+        _pause()
 
         for player in players:
             if player.stand and not dealer.hand.blackjack:
                 resolve_dealer_hand(game_deck, dealer, players)
                 break
 
-        remove_bankrupt_players(players)
+        announce_bankrupt_players(players)
 
-        if not players:
-            print("All players have gone bankrupt, the game is over.")
+        if not any(player.money for player in players):
+            log("All players have gone bankrupt, the game is over.")
         else:
             ask_to_continue(players)
 
-    print("There are no more players, goodbye!")
+        remove_departed_players(players)
+
+        log.flush()
+
+    log("There are no more players, goodbye!")
+    log.flush()
         
 
-if __name__ == "__main__":       
-    play_game()  
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play blackjack on the command line.")
+    parser.add_argument("--no-pause", action="store_true",
+        help="don't pause between moves for suspense")
+    args = parser.parse_args()
+    play_game(pause=not args.no_pause)
 
 # TO DO (things I would have implemented with additional time):
 
@@ -0,0 +1,136 @@
+#Dealer-outcome cache for the blackjack game in blackjack.py
+
+#The dealer's play is fixed by the rules (draw below 17, stand on soft 17), so the
+#chance of each final dealer result depends only on the dealer's faceup card and on
+#which cards have already left the deck. Those two things recur constantly when
+#many rounds are analyzed, so each distribution is worked out once and stored.
+
+#Removed cards are described by rank class: 0 is an Ace, 1-8 are the 2 through 9,
+#and 9 is any 10-point card. A sorted tuple of rank classes is a multiset, and
+#address() numbers every multiset of a given size with the combinatorial number
+#system (Pascal-triangle binomials), so it can be used as a compact cache key.
+
+#simulate.py uses this for its exact stand-EV report; the figures here can be checked
+#with "python -m doctest dealer_cache.py".
+
+from math import comb
+
+from blackjack import LIMIT
+
+RANK_CLASSES = 10
+
+#Points for each rank class, with an Ace tallied as 1
+CLASS_POINTS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+
+#Number of each rank class in a full 52-card deck
+FULL_DECK_COUNTS = (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+
+#Indexes into the outcome vectors returned by dealer_outcomes()
+OUTCOMES = ("bust", "17", "18", "19", "20", "21", "blackjack")
+BUST = 0
+BLACKJACK = 6
+
+DEALER_STANDS = 17
+
+J_MAX = 52
+
+#T[j][N] is the number of multisets of size j drawn from N rank classes.
+T = tuple(tuple(comb(max(N + j - 1, 0), j) for N in range(RANK_CLASSES + 1))
+    for j in range(J_MAX + 1))
+
+#K[j] is the address of the first multiset of size j: all smaller multisets come first.
+K = tuple(sum(T[i][RANK_CLASSES] for i in range(j)) for j in range(J_MAX + 1))
+
+DEALER_CACHE = {}
+
+
+def address(sorted_removed):
+    '''Return the unique cache address of a sorted tuple of removed rank classes'''
+
+    j = len(sorted_removed)
+    return K[j] + sum(T[i][rank] for i, rank in enumerate(sorted_removed, 1))
+
+
+def rank_class(card):
+    '''Return the rank class of a Card'''
+
+    return min(card.rank_idx, RANK_CLASSES - 1)
+
+
+def _dealer_draw(counts, hard_total, aces, card_count, memo):
+    '''Return the outcome probabilities for a dealer hand drawing from counts'''
+
+    value = hard_total + 10 if aces and hard_total + 10 <= LIMIT else hard_total
+
+    if value >= DEALER_STANDS:
+        outcome = [0.0] * len(OUTCOMES)
+        if value > LIMIT:
+            outcome[BUST] = 1.0
+        elif value == LIMIT and card_count == 2:
+            outcome[BLACKJACK] = 1.0
+        else:
+            outcome[value - DEALER_STANDS + 1] = 1.0
+        return outcome
+
+    #Once the hand has 3 or more cards, only the total and whether it holds an ace
+    #matter, so equivalent draw orders share a result.
+    key = (tuple(counts), hard_total, bool(aces), card_count == 1)
+    if key in memo:
+        return memo[key]
+
+    remaining = sum(counts)
+    outcome = [0.0] * len(OUTCOMES)
+
+    for rank in range(RANK_CLASSES):
+        count = counts[rank]
+        if not count:
+            continue
+
+        counts[rank] -= 1
+        result = _dealer_draw(counts, hard_total + CLASS_POINTS[rank],
+            aces + (rank == 0), card_count + 1, memo)
+        counts[rank] += 1
+
+        weight = count / remaining
+        for i in range(len(OUTCOMES)):
+            outcome[i] += weight * result[i]
+
+    memo[key] = outcome
+    return outcome
+
+
+def dealer_outcomes(upcard_class, sorted_removed):
+    '''Return the probability of each dealer result (see OUTCOMES) given the rank
+    class of the faceup card and the sorted rank classes of the other removed cards.
+    The dealer's facedown card must not be among the removed cards: it is still
+    unknown, so it is drawn from the rest of the deck like any other dealer card.
+
+    A faceup 6 from a full single deck, checked against published figures:
+    >>> round(dealer_outcomes(5, ())[BUST], 4)
+    0.4208
+    '''
+
+    if not all(0 <= rank < RANK_CLASSES for rank in (upcard_class, *sorted_removed)):
+        raise ValueError(f"Rank classes must be between 0 and {RANK_CLASSES - 1}.")
+
+    if any(a > b for a, b in zip(sorted_removed, sorted_removed[1:])):
+        raise ValueError("The removed rank classes must be sorted.")
+
+    counts = list(FULL_DECK_COUNTS)
+    counts[upcard_class] -= 1
+    for rank in sorted_removed:
+        counts[rank] -= 1
+
+    #Checked before address(), which only covers multisets of up to J_MAX cards
+    if min(counts) < 0:
+        raise ValueError("More cards of a rank were removed than a deck holds.")
+
+    key = (upcard_class, address(sorted_removed))
+    if key in DEALER_CACHE:
+        return DEALER_CACHE[key]
+
+    outcome = tuple(_dealer_draw(counts, CLASS_POINTS[upcard_class],
+        int(upcard_class == 0), 1, {}))
+
+    DEALER_CACHE[key] = outcome
+    return outcome
@@ -0,0 +1,243 @@
+#Batch self-play for the blackjack game in blackjack.py
+
+#The interactive game asks for every decision with input(), which makes it impossible
+#to play thousands of rounds to find out what a strategy is worth. This module plays
+#a single hand against the dealer under the same rules (dealer stands on soft 17,
+#natural blackjack pays 3:2) using only integers, with the player's decisions taken
+#from a strategy table instead of the keyboard.
+
+#Simplifications compared to the interactive game: one player, no splitting, and
+#doubling down is only offered on the first two cards, for the full original bet.
+
+from random import Random
+
+from blackjack import LIMIT, POINTS, RANKS, SUITS
+from dealer_cache import BLACKJACK, BUST, CLASS_POINTS, DEALER_STANDS, dealer_outcomes
+
+#A deck is a sequence of rank indexes (0 is an Ace, 12 is a King), dealt from the end.
+DECK_RANKS = bytes(rank for suit in SUITS for rank in range(len(RANKS)))
+
+#A hand is packed into a single int: bits 0-5 hold its value, with soft Aces counted
+#as 11, and the bits from SOFT_SHIFT up count the soft Aces (like Hand.soft_aces).
+#Drawing a card adds HAND_DELTA[rank]; if that goes bust while an Ace is still soft,
+#subtracting ACE_TO_ONE counts one Ace as 1. One such step is always enough, since
+#the hand was worth at most 20 before the draw.
+VALUE_MASK = 0x3F
+SOFT_SHIFT = 8
+HAND_DELTA = tuple(points + ((points == 11) << SOFT_SHIFT) for points in POINTS)
+ACE_TO_ONE = 10 + (1 << SOFT_SHIFT)
+
+#Column of the strategy table for each rank of dealer's faceup card (Ace = 1)
+UPCARD_POINTS = tuple(1 if points == 11 else points for points in POINTS)
+
+#Strategy table entries
+STAND = 0
+HIT = 1
+DOUBLE = 2
+
+
+def basic_strategy():
+    '''Build a simplified basic strategy table, indexed as
+    table[hand value][dealer's faceup points, Ace = 1][soft]'''
+
+    table = [[[STAND, STAND] for up in range(11)] for value in range(LIMIT + 1)]
+
+    for up in range(1, 11):
+        weak_dealer = 2 <= up <= 6
+
+        for value in range(LIMIT + 1):
+            #Hard hands (no Ace being counted as 11)
+            if value <= 8:
+                hard = HIT
+            elif value == 9:
+                hard = DOUBLE if 3 <= up <= 6 else HIT
+            elif value == 10:
+                hard = DOUBLE if 2 <= up <= 9 else HIT
+            elif value == 11:
+                hard = DOUBLE if up != 1 else HIT
+            elif value == 12:
+                hard = STAND if 4 <= up <= 6 else HIT
+            elif value <= 16:
+                hard = STAND if weak_dealer else HIT
+            else:
+                hard = STAND
+
+            #Soft hands (an Ace is being counted as 11)
+            if value <= 14:
+                soft = DOUBLE if 5 <= up <= 6 else HIT
+            elif value <= 16:
+                soft = DOUBLE if 4 <= up <= 6 else HIT
+            elif value == 17:
+                soft = DOUBLE if 3 <= up <= 6 else HIT
+            elif value == 18:
+                soft = STAND if 2 <= up <= 8 else HIT
+            else:
+                soft = STAND
+
+            table[value][up] = [hard, soft]
+
+    return table
+
+
+BASIC_STRATEGY = basic_strategy()
+
+
+def compile_strategy(strategy):
+    '''Check a strategy table and rearrange it for simulate_round, as an immutable
+    table indexed as compiled[dealer's faceup points][hand value][soft]'''
+
+    if len(strategy) != LIMIT + 1 or any(len(row) != 11
+            or any(len(actions) != 2 for actions in row) for row in strategy):
+        raise ValueError(f"A strategy table must be {LIMIT + 1} x 11 x 2.")
+
+    compiled = tuple(tuple((strategy[value][up][0], strategy[value][up][1])
+        for value in range(LIMIT + 1)) for up in range(11))
+
+    if not all(action in (STAND, HIT, DOUBLE) for column in compiled
+            for actions in column for action in actions):
+        raise ValueError("A strategy table may only contain STAND, HIT or DOUBLE.")
+
+    return compiled
+
+#Doing this once per run, before any rounds are played, means a bad table fails
+#straight away instead of partway through, and each round only has to look up the
+#column for the dealer's faceup card once.
+
+
+def simulate_round(deck, strategy, bet):
+    '''Play one round from a shuffled deck of rank indexes, using a strategy from
+    compile_strategy, and return the player's profit (or loss, if negative)'''
+
+    top = len(deck) - 1
+
+    #Cards are dealt alternately to the player and the dealer, as in deal_hands
+    player = HAND_DELTA[deck[top]] + HAND_DELTA[deck[top - 2]]
+    dealer = HAND_DELTA[deck[top - 1]] + HAND_DELTA[deck[top - 3]]
+    player -= ACE_TO_ONE * (((player & VALUE_MASK) > LIMIT) & (player > VALUE_MASK))
+    dealer -= ACE_TO_ONE * (((dealer & VALUE_MASK) > LIMIT) & (dealer > VALUE_MASK))
+
+    #The dealer's faceup card is the second one they were dealt
+    column = strategy[UPCARD_POINTS[deck[top - 3]]]
+    top -= 4
+
+    if dealer & VALUE_MASK == LIMIT:
+        return 0 if player & VALUE_MASK == LIMIT else -bet
+
+    if player & VALUE_MASK == LIMIT:
+        return int(1.5 * bet)
+
+    first_decision = True
+    while player & VALUE_MASK < LIMIT:
+        action = column[player & VALUE_MASK][player > VALUE_MASK]
+
+        if action == STAND:
+            break
+
+        player += HAND_DELTA[deck[top]]
+        top -= 1
+        player -= ACE_TO_ONE * (((player & VALUE_MASK) > LIMIT) & (player > VALUE_MASK))
+
+        if action == DOUBLE and first_decision:
+            bet *= 2
+            break
+
+        first_decision = False
+
+    player_value = player & VALUE_MASK
+    if player_value > LIMIT:
+        return -bet
+
+    while dealer & VALUE_MASK < DEALER_STANDS:
+        dealer += HAND_DELTA[deck[top]]
+        top -= 1
+        dealer -= ACE_TO_ONE * (((dealer & VALUE_MASK) > LIMIT) & (dealer > VALUE_MASK))
+
+    dealer_value = dealer & VALUE_MASK
+    if dealer_value > LIMIT or player_value > dealer_value:
+        return bet
+
+    if player_value == dealer_value:
+        return 0
+
+    return -bet
+
+
+def shuffled_decks(n_rounds, seed=None):
+    '''Return n_rounds freshly shuffled decks laid end to end in one bytearray'''
+
+    #Sorting by random keys gives every ordering of the deck with equal probability,
+    #and is quicker in pure Python than calling Random.shuffle or Random.sample
+    #(each of which makes several Python-level calls per card) once per round.
+    random = Random(seed).random
+    deck_size = len(DECK_RANKS)
+
+    decks = bytearray(deck_size * n_rounds)
+    for start in range(0, len(decks), deck_size):
+        decks[start:start + deck_size] = sorted(DECK_RANKS, key=lambda rank: random())
+
+    return decks
+
+
+def simulate(n_rounds, strategy=BASIC_STRATEGY, bet=10, seed=None):
+    '''Play n_rounds rounds, each from a freshly shuffled deck, and return a list
+    of the player's profit or loss on each round'''
+
+    if n_rounds < 1:
+        raise ValueError("At least 1 round must be simulated.")
+
+    strategy = compile_strategy(strategy)
+    decks = memoryview(shuffled_decks(n_rounds, seed))
+    deck_size = len(DECK_RANKS)
+
+    return [simulate_round(decks[start:start + deck_size], strategy, bet)
+        for start in range(0, len(decks), deck_size)]
+
+
+def stand_expectation(player_classes, upcard_class):
+    '''Return the exact expected result, per unit bet, of standing on a hand of the
+    given rank classes (see dealer_cache) against the dealer's faceup card, once the
+    dealer is known not to have a natural blackjack'''
+
+    player_total = sum(CLASS_POINTS[rank] for rank in player_classes)
+    if 0 in player_classes and player_total + 10 <= LIMIT:
+        player_total += 10
+
+    outcomes = dealer_outcomes(upcard_class, tuple(sorted(player_classes)))
+
+    expectation = outcomes[BUST]
+    for i, dealer_value in enumerate(range(DEALER_STANDS, LIMIT + 1), 1):
+        if player_total > dealer_value:
+            expectation += outcomes[i]
+        elif player_total < dealer_value:
+            expectation -= outcomes[i]
+
+    return expectation / (1 - outcomes[BLACKJACK])
+
+
+def analyze_strategy(n_rounds=100000, strategy=BASIC_STRATEGY, bet=10, seed=None):
+    '''Print the average result per round of playing a strategy'''
+
+    results = simulate(n_rounds, strategy, bet, seed)
+    average = sum(results) / n_rounds
+
+    print(f"Over {n_rounds} rounds with a ${bet} bet, this strategy wins an average "
+        f"of ${average:.3f} per round ({100 * average / bet:+.2f}% of the bet).")
+
+
+def print_stand_expectations(player_classes):
+    '''Print the exact result of standing on a hand of the given rank classes against
+    each possible dealer's faceup card'''
+
+    upcards = [(upcard_class, RANKS[upcard_class]) for upcard_class in range(1, 10)]
+    upcards.append((0, "A"))
+
+    names = " + ".join("A" if rank == 0 else RANKS[rank] for rank in player_classes)
+    print(f"Exact result of standing on {names}, per $1 bet, against each faceup card:")
+    print(", ".join(f"{name}: {stand_expectation(player_classes, upcard_class):+.3f}"
+        for upcard_class, name in upcards))
+
+
+if __name__ == "__main__":
+    analyze_strategy()
+    #Hard 16 (10 + 6) is the classic close call, so show exactly what standing is worth
+    print_stand_expectations((9, 5))